@@ -12,7 +12,6 @@ import time
 
 from argparse import Namespace
 from dataclasses import dataclass, asdict
-from importlib import metadata
 from enum import Enum
 from collections import Counter
 
@@ -65,6 +64,13 @@ VERBOSITY_TRACE_SETUP = 3
 VERBOSITY_TRACE_PATHS = 4
 VERBOSITY_TRACE_CONSTRUCTOR = 5
 
+# natspec tags, e.g., @custom:halmos
+NATSPEC_TAG_SPLIT_PATTERN = re.compile(r"(@\S+)")
+NATSPEC_TAG_PATTERN = re.compile(r"^@\S")
+
+# tuple types in the ABI, e.g., tuple, tuple[], tuple[2][]
+ABI_TUPLE_TYPE_PATTERN = re.compile(r"^tuple((\[[0-9]*\])*)$")
+
 
 @dataclass(frozen=True)
 class FunctionInfo:
@@ -78,7 +84,7 @@ def str_abi(item: Dict) -> str:
         ret = []
         for arg in args:
             typ = arg["type"]
-            match = re.search(r"^tuple((\[[0-9]*\])*)$", typ)
+            match = ABI_TUPLE_TYPE_PATTERN.search(typ)
             if match:
                 ret.append(str_tuple(arg["components"]) + match.group(1))
             else:
@@ -525,9 +531,12 @@ def setup(
                 print("\n".join(sevm.logs.bounded_loops))
 
     if args.reset_bytecode:
-        for assign in [x.split("=") for x in args.reset_bytecode.split(",")]:
-            addr = con_addr(int(assign[0].strip(), 0))
-            new_hexcode = assign[1].strip()
+        for assign in args.reset_bytecode.split(","):
+            addr_str, sep, new_hexcode = assign.partition("=")
+            if not sep:
+                raise ValueError(f"invalid --reset-bytecode entry: {assign!r}")
+            addr = con_addr(int(addr_str.strip(), 0))
+            new_hexcode = new_hexcode.strip()
             setup_ex.code[addr] = Contract.from_hexcode(new_hexcode)
 
     if args.statistics:
@@ -994,9 +1003,12 @@ def run_sequential(run_args: RunArgs) -> List[TestResult]:
 
 
 def extend_args(args: Namespace, more_opts: str) -> Namespace:
-    if more_opts:
-        new_args = deepcopy(args)
-        arg_parser.parse_args(more_opts.split(), new_args)
+    # annotations without any options (e.g., whitespace only) reuse args as is
+    opts = more_opts.split() if more_opts else None
+    if opts:
+        # all option values are immutable, so a shallow copy is sufficient
+        new_args = Namespace(**vars(args))
+        arg_parser.parse_args(opts, new_args)
         return new_args
     else:
         return args
@@ -1195,10 +1207,9 @@ def mk_options(args: Namespace) -> Dict:
     if args.loop is not None:
         options["max_loop"] = args.loop
 
-    options["unknown_calls"] = []
-    if args.uninterpreted_unknown_calls.strip():
-        for x in args.uninterpreted_unknown_calls.split(","):
-            options["unknown_calls"].append(int(x, 0))
+    options["unknown_calls"] = [
+        int(x, 0) for x in args.uninterpreted_unknown_calls.split(",") if x.strip()
+    ]
 
     return options
 
@@ -1206,10 +1217,11 @@ def mk_options(args: Namespace) -> Dict:
 def mk_arrlen(args: Namespace) -> Dict[str, int]:
     arrlen = {}
     if args.array_lengths:
-        for assign in [x.split("=") for x in args.array_lengths.split(",")]:
-            name = assign[0].strip()
-            size = assign[1].strip()
-            arrlen[name] = int(size)
+        for assign in args.array_lengths.split(","):
+            name, sep, size = assign.partition("=")
+            if not sep:
+                raise ValueError(f"invalid --array-lengths entry: {assign!r}")
+            arrlen[name.strip()] = int(size)
     return arrlen
 
 
@@ -1311,10 +1323,10 @@ def parse_natspec(natspec: Dict) -> str:
     # In all the above examples, this scheme returns "--x (whitespaces) --y"
     isHalmosTag = False
     result = ""
-    for item in re.split(r"(@\S+)", natspec.get("text", "")):
+    for item in NATSPEC_TAG_SPLIT_PATTERN.split(natspec.get("text", "")):
         if item == "@custom:halmos":
             isHalmosTag = True
-        elif re.match(r"^@\S", item):
+        elif NATSPEC_TAG_PATTERN.match(item):
             isHalmosTag = False
         elif isHalmosTag:
             result += item
@@ -1391,6 +1403,9 @@ def _main(_args=None) -> MainResult:
     args = arg_parser.parse_args(_args)
 
     if args.version:
+        # imported lazily; importlib.metadata is only needed for --version
+        from importlib import metadata
+
         print(f"Halmos {metadata.version('halmos')}")
         return MainResult(0)
 
@@ -1466,8 +1481,12 @@ def _main(_args=None) -> MainResult:
     # run
     #
 
+    # compile the name filters once, rather than per contract and per method
+    contract_pattern = re.compile(contract_regex(args))
+    test_pattern = re.compile(test_regex(args))
+
     for build_out_map, filename, contract_name in build_output_iterator(build_out):
-        if not re.search(contract_regex(args), contract_name):
+        if not contract_pattern.search(contract_name):
             continue
 
         (contract_json, contract_type, natspec) = build_out_map[filename][contract_name]
@@ -1475,7 +1494,7 @@ def _main(_args=None) -> MainResult:
             continue
 
         methodIdentifiers = contract_json["methodIdentifiers"]
-        funsigs = [f for f in methodIdentifiers if re.search(test_regex(args), f)]
+        funsigs = [f for f in methodIdentifiers if test_pattern.search(f)]
         num_found = len(funsigs)
 
         if num_found == 0:
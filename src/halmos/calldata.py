@@ -11,6 +11,13 @@ from z3 import *
 
 from .sevm import con, concat
 
+# e.g., uint256[], bytes32[3], tuple[2][]
+ARRAY_TYPE_PATTERN = re.compile(r"^(.*)(\[([0-9]*)\])$")
+
+SUPPORTED_TYPE_PATTERN = re.compile(
+    r"^(u?int[0-9]*|address|bool|bytes[0-9]*|string|tuple)$"
+)
+
 
 @dataclass(frozen=True)
 class Type:
@@ -41,8 +48,8 @@ class TupleType(Type):
 def parse_type(var: str, typ: str, item: Dict) -> Type:
     """Parse ABI type in JSON format"""
 
-    # parse array type
-    match = re.search(r"^(.*)(\[([0-9]*)\])$", typ)
+    # parse array type; only array types end with ']', so skip the regex otherwise
+    match = ARRAY_TYPE_PATTERN.search(typ) if typ.endswith("]") else None
     if match:
         base_type = match.group(1)
         array_len = match.group(3)
@@ -56,7 +63,7 @@ def parse_type(var: str, typ: str, item: Dict) -> Type:
             return FixedArrayType(var, base, int(array_len))
 
     # check supported type
-    match = re.search(r"^(u?int[0-9]*|address|bool|bytes[0-9]*|string|tuple)$", typ)
+    match = SUPPORTED_TYPE_PATTERN.search(typ)
     if not match:
         # TODO: support fixedMxN, ufixedMxN, function types
         raise NotImplementedError(f"Not supported type: {typ}")
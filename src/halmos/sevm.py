@@ -1,12 +1,11 @@
 # SPDX-License-Identifier: AGPL-3.0
 
 import math
-import re
 
 from copy import deepcopy
 from collections import defaultdict
 from dataclasses import dataclass, field
-from functools import reduce, lru_cache
+from functools import reduce
 from typing import (
     Any,
     Callable,
@@ -40,6 +39,12 @@ MAX_CALL_DEPTH = 1024
 # TODO: make this configurable
 MAX_MEMORY_SIZE = 2**20
 
+# opcode groups, used for membership tests in the interpreter loop
+TERMINATING_OPCODES = frozenset([EVM.STOP, EVM.INVALID, EVM.REVERT, EVM.RETURN])
+BITWISE_OPCODES = frozenset([EVM.AND, EVM.OR, EVM.XOR])
+CALL_OPCODES = frozenset([EVM.CALL, EVM.CALLCODE, EVM.DELEGATECALL, EVM.STATICCALL])
+CREATE_OPCODES = frozenset([EVM.CREATE, EVM.CREATE2])
+
 
 # symbolic states
 # calldataload(index)
@@ -531,6 +536,9 @@ class Contract:
         # cache length since it doesn't change after initialization
         self._length = byte_length(rawcode)
 
+        # per-instance cache of decoded bytes, released together with the contract
+        self._byte_cache = {}
+
     def __init_jumpdests(self):
         self.jumpdests = set()
 
@@ -587,9 +595,14 @@ class Contract:
         data = padded_slice(self._rawcode, start, size, default=0)
         return bytes(data)
 
-    @lru_cache(maxsize=256)
     def __getitem__(self, key: int) -> UnionType[int, BitVecRef]:
         """Returns the byte at the given offset."""
+        byte = self._byte_cache.get(key)
+        if byte is None:
+            byte = self._byte_cache[key] = self.__byte_at(key)
+        return byte
+
+    def __byte_at(self, key: int) -> UnionType[int, BitVecRef]:
         offset = int_of(key, "symbolic index into contract bytecode {offset!r}")
 
         # support for negative indexing, e.g. contract[-1]
@@ -925,8 +938,12 @@ class Exec:  # an execution path
                     return self.select(base, key, arrays)
                 if self.check(key != key0) == unsat:  # key == key0
                     return val0
-        # empty array
-        elif not self.symbolic and re.search(r"^storage_.+_00$", str(array)):
+        # empty array, i.e., the name matches ^storage_.+_00$
+        elif (
+            not self.symbolic
+            and (name := str(array)).startswith("storage_")
+            and name.endswith("_00", len("storage_") + 1)
+        ):
             # note: simplifying empty array access might have a negative impact on solver performance
             return con(0)
         return Select(array, key)
@@ -2267,7 +2284,7 @@ class SEVM:
                 if self.options.get("print_steps"):
                     print(ex)
 
-                if opcode in [EVM.STOP, EVM.INVALID, EVM.REVERT, EVM.RETURN]:
+                if opcode in TERMINATING_OPCODES:
                     if opcode == EVM.STOP:
                         ex.halt()
                     elif opcode == EVM.INVALID:
@@ -2340,7 +2357,7 @@ class SEVM:
                 elif opcode == EVM.ISZERO:
                     ex.st.push(is_zero(ex.st.pop()))
 
-                elif opcode in [EVM.AND, EVM.OR, EVM.XOR]:
+                elif opcode in BITWISE_OPCODES:
                     ex.st.push(bitwise(opcode, ex.st.pop(), ex.st.pop()))
                 elif opcode == EVM.NOT:
                     ex.st.push(~b2i(ex.st.pop()))  # bvnot
@@ -2442,19 +2459,14 @@ class SEVM:
                 elif opcode == EVM.SELFBALANCE:
                     ex.st.push(ex.balance_of(ex.this))
 
-                elif opcode in [
-                    EVM.CALL,
-                    EVM.CALLCODE,
-                    EVM.DELEGATECALL,
-                    EVM.STATICCALL,
-                ]:
+                elif opcode in CALL_OPCODES:
                     self.call(ex, opcode, stack, step_id)
                     continue
 
                 elif opcode == EVM.SHA3:
                     ex.sha3()
 
-                elif opcode in [EVM.CREATE, EVM.CREATE2]:
+                elif opcode in CREATE_OPCODES:
                     self.create(ex, opcode, stack, step_id)
                     continue
 
@@ -7,7 +7,14 @@ from halmos.utils import EVM
 
 from halmos.sevm import con, Contract, Instruction
 
-from halmos.__main__ import str_abi, run_bytecode, FunctionInfo
+from halmos.__main__ import (
+    str_abi,
+    run_bytecode,
+    extend_args,
+    mk_arrlen,
+    setup as setup_test_contract,
+    FunctionInfo,
+)
 
 from test_fixtures import args, options
 
@@ -365,3 +372,32 @@ def test_decode():
 )
 def test_str_abi(sig, abi):
     assert sig == str_abi(json.loads(abi))
+
+
+def test_extend_args(args):
+    # annotations without options reuse the given args
+    assert extend_args(args, None) is args
+    assert extend_args(args, "") is args
+    assert extend_args(args, "  \n  ") is args
+
+    # options are applied to a copy, leaving the given args untouched
+    new_args = extend_args(args, "--loop 7 -v")
+    assert new_args is not args
+    assert (new_args.loop, new_args.verbose) == (7, args.verbose + 1)
+    assert args.loop == 2
+
+
+def test_mk_arrlen(args):
+    args.array_lengths = "x=1, y = 2"
+    assert mk_arrlen(args) == {"x": 1, "y": 2}
+
+    args.array_lengths = "x=1,y"
+    with pytest.raises(ValueError, match="invalid --array-lengths entry: 'y'"):
+        mk_arrlen(args)
+
+
+def test_setup_invalid_reset_bytecode(args):
+    args.no_test_constructor = True
+    args.reset_bytecode = "0xaaaa0002"
+    with pytest.raises(ValueError, match="invalid --reset-bytecode entry"):
+        setup_test_contract("", "", [], FunctionInfo(), args, {})